@@ -3,12 +3,37 @@ Azure Configuration Manager
 Handles all Azure service configurations and credentials
 """
 import os
+import warnings
 from dotenv import load_dotenv
 from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.core.credentials import AzureKeyCredential
 from azure.storage.blob import BlobServiceClient
 
 
+DEFAULT_BLOB_DOWNLOAD_CONCURRENCY = 8
+
+
+def _read_positive_int(name, default):
+    """
+    Read a positive integer from an environment variable.
+    
+    Args:
+        name (str): Environment variable name
+        default (int): Value used when the variable is unset or invalid
+        
+    Returns:
+        int: Parsed value, at least 1
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        warnings.warn(f"Invalid {name}={value!r}; using {default}")
+        return default
+
+
 class AzureConfig:
     """
     Loads and manages Azure configuration from environment variables.
@@ -23,6 +48,9 @@ class AzureConfig:
         self.doc_intelligence_key = os.getenv('DOC_INTELLIGENCE_KEY')
         self.blob_connection_string = os.getenv('AZURE_BLOB_CONNECTION_STRING')
         self.blob_container = os.getenv('AZURE_BLOB_CONTAINER')
+        self.blob_download_concurrency = _read_positive_int(
+            'AZURE_BLOB_DOWNLOAD_CONCURRENCY', DEFAULT_BLOB_DOWNLOAD_CONCURRENCY
+        )
         
         # Validate required credentials
         if not (self.doc_intelligence_endpoint and self.doc_intelligence_key):
@@ -8,12 +8,97 @@ from utils.blob_manager import BlobManager
 from utils.file_utils import (
     is_csv_or_excel_file, 
     is_document_or_image_file, 
-    read_csv_or_excel_file
+    read_csv_or_excel_file,
+    compute_file_hash
 )
 from table_extractor import TableExtractor
 from ui_handler import UIHandler
 
 
+# Seconds before the cached blob listing is refreshed from Azure
+BLOB_CACHE_TTL = 60
+
+
+@st.cache_resource(show_spinner=False)
+def get_config():
+    """
+    Load Azure configuration once per process instead of on every rerun.
+    
+    Returns:
+        AzureConfig: Shared configuration loaded from the environment
+    """
+    return AzureConfig()
+
+
+@st.cache_resource(show_spinner=False)
+def get_blob_manager(connection_string, container_name, max_concurrency):
+    """
+    Create a blob manager once and reuse it across Streamlit reruns.
+    
+    Args:
+        connection_string (str): Azure blob storage connection string
+        container_name (str): Container name
+        max_concurrency (int): Parallel ranged GETs used per download
+        
+    Returns:
+        BlobManager: Shared blob manager instance
+    """
+    return BlobManager(connection_string, container_name, max_concurrency=max_concurrency)
+
+
+@st.cache_resource(show_spinner=False)
+def get_table_extractor(_config, endpoint, key):
+    """
+    Create the Document Intelligence client once and reuse it across reruns.
+    
+    Args:
+        _config (AzureConfig): Azure configuration (excluded from the cache key)
+        endpoint (str): Document Intelligence endpoint used as the cache key
+        key (str): Document Intelligence key used as the cache key
+        
+    Returns:
+        TableExtractor: Shared table extractor instance
+    """
+    return TableExtractor(_config.get_document_client())
+
+
+@st.cache_data(ttl=BLOB_CACHE_TTL, show_spinner=False)
+def list_blob_files(_blob_manager, account_name, container_name):
+    """
+    List blob files, reusing the result across reruns until the TTL expires.
+    
+    Args:
+        _blob_manager: Blob manager instance (excluded from the cache key)
+        account_name (str): Storage account name used as part of the cache key
+        container_name (str): Container name used as part of the cache key
+        
+    Returns:
+        list: List of blob file names
+    """
+    return _blob_manager.list_files()
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def download_blob_file(_blob_manager, account_name, container_name, blob_name, etag):
+    """
+    Download a blob, keeping the most recent files in memory across reruns.
+    
+    Keyed on the blob's ETag, so a cached copy is reused until the blob
+    is overwritten and is never served after it changes.
+    
+    Args:
+        _blob_manager: Blob manager instance (excluded from the cache key)
+        account_name (str): Storage account name used as part of the cache key
+        container_name (str): Container name used as part of the cache key
+        blob_name (str): Name of the blob to download
+        etag (str): Current ETag of the blob used as part of the cache key
+        
+    Returns:
+        bytes: File content as bytes
+    """
+    return _blob_manager.download_file(blob_name, etag=etag)
+
+
 def initialize_services():
     """
     Initialize all required services and configurations.
@@ -22,19 +107,23 @@ def initialize_services():
         tuple: (config, blob_manager, table_extractor, ui_handler)
     """
     try:
-        config = AzureConfig()
+        config = get_config()
         ui_handler = UIHandler()
         
         # Initialize Document Intelligence client
-        document_client = config.get_document_client()
-        table_extractor = TableExtractor(document_client)
+        table_extractor = get_table_extractor(
+            config,
+            config.doc_intelligence_endpoint,
+            config.doc_intelligence_key
+        )
         
         # Initialize Blob Manager if credentials available
         blob_manager = None
         if config.has_blob_storage():
-            blob_manager = BlobManager(
+            blob_manager = get_blob_manager(
                 config.blob_connection_string, 
-                config.blob_container
+                config.blob_container,
+                config.blob_download_concurrency
             )
         
         return config, blob_manager, table_extractor, ui_handler
@@ -58,10 +147,14 @@ def get_file_data(file_source, blob_manager, uploaded_file, selected_file):
         tuple: (file_bytes, file_name)
     """
     if file_source == "Azure Blob" and selected_file and blob_manager:
-        file_bytes = blob_manager.download_file(selected_file)
+        etag = blob_manager.get_etag(selected_file)
+        file_bytes = download_blob_file(
+            blob_manager, blob_manager.account_name, blob_manager.container_name, selected_file, etag
+        )
         file_name = selected_file
     elif file_source == "Local Upload" and uploaded_file:
-        file_bytes = uploaded_file.read()
+        # getvalue() hands back the upload buffer's bytes without copying or moving the read position
+        file_bytes = uploaded_file.getvalue()
         file_name = uploaded_file.name
     else:
         return None, None
@@ -69,6 +162,44 @@ def get_file_data(file_source, blob_manager, uploaded_file, selected_file):
     return file_bytes, file_name
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def extract_tables_cached(file_hash, _file_bytes, _file_name, _table_extractor):
+    """
+    Extract tables, reusing earlier results for identical file content.
+    
+    Results are keyed only on a hash of the file bytes, so renamed copies
+    hit the cache and changed content under the same name is analyzed
+    again. The cache is shared across sessions and bounded in size.
+    
+    Args:
+        file_hash (str): Content hash of the file, used as the cache key
+        _file_bytes (bytes): Document content as bytes
+        _file_name (str): Name of the file
+        _table_extractor: Table extractor instance
+        
+    Returns:
+        list: List of table information dictionaries
+    """
+    return _table_extractor.extract_tables_from_document(_file_bytes, _file_name)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def read_sheets_cached(file_hash, _file_bytes, file_name):
+    """
+    Parse CSV/Excel sheets, reusing earlier results for identical content.
+    
+    Args:
+        file_hash (str): Content hash of the file, used as the cache key
+        _file_bytes (bytes): File content as bytes
+        file_name (str): Name of the file, selects the CSV or Excel parser
+        
+    Returns:
+        dict: Dictionary of sheet name to DataFrame
+    """
+    _, _, _, sheets = read_csv_or_excel_file(_file_bytes, file_name)
+    return sheets
+
+
 def process_file(file_bytes, file_name, table_extractor, ui_handler):
     """
     Process file based on its type.
@@ -85,13 +216,15 @@ def process_file(file_bytes, file_name, table_extractor, ui_handler):
     if is_csv_or_excel_file(file_name):
         # Process CSV/Excel files directly
         ui_handler.show_processing_info(file_name, "csv_excel")
-        _, _, _, sheets = read_csv_or_excel_file(file_bytes, file_name)
+        sheets = read_sheets_cached(compute_file_hash(file_bytes), file_bytes, file_name)
         return None, sheets
         
     elif is_document_or_image_file(file_name):
         # Process documents/images with OCR
         ui_handler.show_processing_info(file_name, "document")
-        extracted_tables = table_extractor.extract_tables_from_document(file_bytes, file_name)
+        extracted_tables = extract_tables_cached(
+            compute_file_hash(file_bytes), file_bytes, file_name, table_extractor
+        )
         consolidated_table = table_extractor.create_consolidated_table(extracted_tables)
         return consolidated_table, {}
         
@@ -115,7 +248,7 @@ def main():
     if file_source == "Azure Blob":
         if blob_manager:
             try:
-                blob_files = blob_manager.list_files()
+                blob_files = list_blob_files(blob_manager, blob_manager.account_name, blob_manager.container_name)
                 selected_file = ui_handler.render_blob_file_selector(blob_files)
             except Exception as e:
                 ui_handler.show_error(f"Error accessing blob storage: {e}")
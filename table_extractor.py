@@ -3,10 +3,9 @@ Table Extraction Engine
 Core functionality for extracting tables from documents using Azure Document Intelligence
 """
 import io
+import numpy as np
 import pandas as pd
-from azure.ai.formrecognizer import DocumentAnalysisClient
 from utils.currency_utils import is_table_budget_related
-from utils.file_utils import clean_dataframe
 
 
 class TableExtractor:
@@ -43,20 +42,18 @@ class TableExtractor:
             
             if result.tables:
                 for table_idx, table in enumerate(result.tables):
-                    # Create a structured table representation
-                    max_row = max([cell.row_index for cell in table.cells]) + 1
-                    max_col = max([cell.column_index for cell in table.cells]) + 1
+                    # Initialize table grid from the reported table dimensions
+                    table_grid = np.full((table.row_count, table.column_count), '', dtype=object)
                     
-                    # Initialize table grid
-                    table_grid = [[''] * max_col for _ in range(max_row)]
-                    
-                    # Fill the grid with cell contents
+                    # Fill the grid with cell contents in a single pass, spreading merged cells over their span
                     for cell in table.cells:
-                        table_grid[cell.row_index][cell.column_index] = cell.content.strip()
+                        row_end = cell.row_index + (cell.row_span or 1)
+                        column_end = cell.column_index + (cell.column_span or 1)
+                        table_grid[cell.row_index:row_end, cell.column_index:column_end] = (cell.content or '').strip()
                     
-                    # Convert to DataFrame
-                    df = pd.DataFrame(table_grid)
-                    df = clean_dataframe(df)
+                    # Drop empty rows on the raw grid, then wrap it in a DataFrame once
+                    non_empty_rows = (table_grid != '').any(axis=1)
+                    df = pd.DataFrame(table_grid[non_empty_rows])
                     
                     # Check if table contains budget-related information
                     is_budget_related = is_table_budget_related(df)
@@ -90,40 +87,38 @@ class TableExtractor:
         if not extracted_tables:
             return pd.DataFrame()
         
-        consolidated_data = []
+        tables = [table for table in extracted_tables if not table['dataframe'].empty]
+        if not tables:
+            return pd.DataFrame()
+        
+        metadata_cols = ['Source_Table', 'Budget_Related', 'Row_Number']
+        max_columns = max(len(table['dataframe'].columns) for table in tables)
+        total_rows = sum(len(table['dataframe']) for table in tables)
         
-        for table in extracted_tables:
+        # Fill one preallocated object array; cells missing from narrower tables stay NaN
+        values = np.full((total_rows, len(metadata_cols) + max_columns), np.nan, dtype=object)
+        start = 0
+        for table in tables:
             df = table['dataframe']
-            table_id = table['table_id']
-            is_budget = table['is_budget_related']
+            end = start + len(df)
             
-            # Add each row of the table to consolidated data
-            for row_idx, row in df.iterrows():
-                # Convert row to a dictionary with column names
-                row_data = {}
-                for col_idx, cell in enumerate(row):
-                    col_name = f"Column_{col_idx + 1}"
-                    row_data[col_name] = str(cell) if cell else ""
-                
-                # Add metadata columns
-                row_data['Source_Table'] = table_id
-                row_data['Budget_Related'] = "Yes" if is_budget else "No"
-                row_data['Row_Number'] = row_idx + 1
-                
-                consolidated_data.append(row_data)
+            # Metadata columns first, then the table's cells
+            values[start:end, 0] = table['table_id']
+            values[start:end, 1] = "Yes" if table['is_budget_related'] else "No"
+            values[start:end, 2] = np.arange(1, len(df) + 1)
+            values[start:end, 3:3 + len(df.columns)] = df.to_numpy(dtype=object)
+            start = end
         
-        # Create DataFrame with consistent columns
-        if consolidated_data:
-            df = pd.DataFrame(consolidated_data)
-            
-            # Reorder columns to put metadata first
-            metadata_cols = ['Source_Table', 'Budget_Related', 'Row_Number']
-            data_cols = [col for col in df.columns if col not in metadata_cols]
-            df = df[metadata_cols + sorted(data_cols)]
-            
-            return df
+        # Data columns in numeric order
+        data_cols = [f"Column_{col_idx + 1}" for col_idx in range(max_columns)]
+        df = pd.DataFrame(values, columns=metadata_cols + data_cols)
+        
+        # Compact dtypes: metadata repeats a few values per table
+        df['Source_Table'] = df['Source_Table'].astype('category')
+        df['Budget_Related'] = df['Budget_Related'].astype('category')
+        df['Row_Number'] = df['Row_Number'].astype('int32')
         
-        return pd.DataFrame()
+        return df
     
     def filter_budget_tables(self, extracted_tables):
         """
@@ -4,7 +4,7 @@ Handles all user interface elements and interactions
 """
 import streamlit as st
 import pandas as pd
-from utils.file_utils import is_excel_file
+from utils.file_utils import is_excel_file, SUPPORTED_EXTENSIONS
 
 
 class UIHandler:
@@ -55,7 +55,7 @@ class UIHandler:
         """
         return st.sidebar.file_uploader(
             "Upload file", 
-            type=['pdf', 'png', 'jpg', 'jpeg', 'bmp', 'tiff', 'tif', 'csv', 'xlsx', 'xls'],
+            type=[ext.lstrip('.') for ext in SUPPORTED_EXTENSIONS],
             help="PDF/Images: Table extraction with budget focus | CSV/Excel: Direct processing"
         )
     
@@ -2,7 +2,54 @@
 Azure Blob Storage Manager
 Handles all blob storage operations
 """
+from azure.core import MatchConditions
+from azure.core.pipeline.transport import RequestsTransport
 from azure.storage.blob import BlobServiceClient
+from requests import Session
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.file_utils import SUPPORTED_EXTENSIONS
+
+
+# Transfer tuning for downloads: first GET size and size of each ranged GET
+MAX_SINGLE_GET_SIZE = 4 * 1024 * 1024
+MAX_CHUNK_GET_SIZE = 4 * 1024 * 1024
+
+# Timeouts (seconds) the storage SDK applies to the transport it builds itself
+CONNECTION_TIMEOUT = 20
+READ_TIMEOUT = 60
+
+
+def create_transport(pool_size, block_size=MAX_CHUNK_GET_SIZE):
+    """
+    Create an HTTP transport whose connection pool fits parallel downloads.
+    
+    The default requests pool keeps 10 connections per host; ranged GETs
+    beyond that open connections that are discarded after each request.
+    Passing a transport skips the storage SDK's own transport setup, so its
+    timeouts and read block size are set here explicitly.
+    
+    Args:
+        pool_size (int): Number of connections to keep per host
+        block_size (int): Bytes read from the socket per iteration (the SDK uses 256 KiB)
+        
+    Returns:
+        RequestsTransport: Transport for Azure SDK clients
+    """
+    # Retries are handled by the Azure SDK pipeline, so disable them here as the SDK does
+    adapter = HTTPAdapter(
+        pool_maxsize=max(pool_size, DEFAULT_POOLSIZE),
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+    )
+    session = Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return RequestsTransport(
+        session=session,
+        connection_timeout=CONNECTION_TIMEOUT,
+        read_timeout=READ_TIMEOUT,
+        connection_data_block_size=block_size
+    )
 
 
 class BlobManager:
@@ -10,21 +57,29 @@ class BlobManager:
     Manages Azure Blob Storage operations for file management.
     """
     
-    def __init__(self, connection_string, container_name):
+    def __init__(self, connection_string, container_name, max_concurrency=8):
         """
         Initialize blob manager.
         
         Args:
             connection_string (str): Azure blob storage connection string
             container_name (str): Container name
+            max_concurrency (int): Parallel ranged GETs used per download
         """
         if not connection_string:
             raise ValueError("Blob storage connection string is required")
         
         self.connection_string = connection_string
         self.container_name = container_name
-        self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+        self.max_concurrency = max_concurrency
+        self.blob_service_client = BlobServiceClient.from_connection_string(
+            connection_string,
+            transport=create_transport(max_concurrency),
+            max_single_get_size=MAX_SINGLE_GET_SIZE,
+            max_chunk_get_size=MAX_CHUNK_GET_SIZE
+        )
         self.container_client = self.blob_service_client.get_container_client(container_name)
+        self.account_name = self.blob_service_client.account_name
     
     def list_files(self, extensions=None):
         """
@@ -37,23 +92,44 @@ class BlobManager:
             list: List of blob file names
         """
         if extensions is None:
-            extensions = ['.pdf', '.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif', '.csv', '.xlsx', '.xls']
+            extensions = SUPPORTED_EXTENSIONS
+        suffixes = tuple(ext.lower() for ext in extensions)
         
         try:
             blobs = []
             for blob in self.container_client.list_blobs():
-                if any(blob.name.lower().endswith(ext.lower()) for ext in extensions):
+                if blob.name.lower().endswith(suffixes):
                     blobs.append(blob.name)
             return blobs
         except Exception as e:
             raise RuntimeError(f"Failed to list blobs: {e}")
     
-    def download_file(self, blob_name):
+    def get_etag(self, blob_name):
+        """
+        Get the current ETag of a blob without downloading it.
+        
+        Args:
+            blob_name (str): Name of the blob
+            
+        Returns:
+            str: Blob ETag, which changes whenever the content changes
+        """
+        try:
+            blob_client = self.blob_service_client.get_blob_client(
+                container=self.container_name, 
+                blob=blob_name
+            )
+            return blob_client.get_blob_properties().etag
+        except Exception as e:
+            raise RuntimeError(f"Failed to read properties of blob '{blob_name}': {e}")
+    
+    def download_file(self, blob_name, etag=None):
         """
         Download a file from blob storage.
         
         Args:
             blob_name (str): Name of the blob to download
+            etag (str): If given, fail unless the blob still has this ETag
             
         Returns:
             bytes: File content as bytes
@@ -63,7 +139,15 @@ class BlobManager:
                 container=self.container_name, 
                 blob=blob_name
             )
-            return blob_client.download_blob().readall()
+            if etag:
+                downloader = blob_client.download_blob(
+                    max_concurrency=self.max_concurrency,
+                    etag=etag,
+                    match_condition=MatchConditions.IfNotModified
+                )
+            else:
+                downloader = blob_client.download_blob(max_concurrency=self.max_concurrency)
+            return downloader.readall()
         except Exception as e:
             raise RuntimeError(f"Failed to download blob '{blob_name}': {e}")
     
@@ -3,6 +3,7 @@ Currency and Budget Detection Utilities
 Contains patterns and functions for identifying budget-related content
 """
 import re
+import pandas as pd
 
 
 # Enhanced currency patterns for detecting monetary values
@@ -14,6 +15,12 @@ CURRENCY_PATTERNS = [
     r'[\d,]+\.?\d*\s*(?:USD|EUR|GBP|INR|AUD|CAD)',  # Currency codes after
 ]
 
+# Currency patterns compiled once at import instead of per cell
+CURRENCY_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in CURRENCY_PATTERNS]
+
+# All currency patterns in one alternation, for yes/no checks in a single scan
+CURRENCY_REGEX = re.compile('|'.join(f'(?:{pattern})' for pattern in CURRENCY_PATTERNS), re.IGNORECASE)
+
 # Keywords that indicate budget/financial content
 BUDGET_KEYWORDS = [
     'amount', 'budget', 'cost', 'price', 'total', 'expense', 'payment',
@@ -22,11 +29,31 @@ BUDGET_KEYWORDS = [
     'profit', 'loss', 'tax', 'discount', 'refund', 'salary', 'wage'
 ]
 
+# Single alternation over all budget keywords, scanned in one pass per cell
+BUDGET_KEYWORDS_REGEX = re.compile('|'.join(re.escape(keyword) for keyword in BUDGET_KEYWORDS))
+
 # Currency symbols and codes
 CURRENCY_SYMBOLS = ['$', '€', '£', '¥', '₹', '₽', '¢', '₩', '₪', '₦']
 CURRENCY_CODES = ['USD', 'EUR', 'GBP', 'INR', 'AUD', 'CAD', 'JPY', 'CNY', 'RUB']
 
 
+def _normalize_text(text):
+    """Convert a cell value to a stripped, lowercased string."""
+    if not isinstance(text, str):
+        text = str(text)
+    return text.strip().lower()
+
+
+def _matches_currency(text):
+    """Check already-normalized text against the currency patterns."""
+    return CURRENCY_REGEX.search(text) is not None
+
+
+def _matches_budget_keywords(text):
+    """Check already-normalized text against the budget keywords."""
+    return BUDGET_KEYWORDS_REGEX.search(text) is not None
+
+
 def contains_currency(text):
     """
     Check if text contains currency patterns.
@@ -37,17 +64,7 @@ def contains_currency(text):
     Returns:
         bool: True if currency pattern found
     """
-    if not isinstance(text, str):
-        text = str(text)
-    
-    text = text.strip().lower()
-    
-    # Check for currency patterns
-    for pattern in CURRENCY_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    
-    return False
+    return _matches_currency(_normalize_text(text))
 
 
 def contains_budget_keywords(text):
@@ -60,12 +77,7 @@ def contains_budget_keywords(text):
     Returns:
         bool: True if budget keywords found
     """
-    if not isinstance(text, str):
-        text = str(text)
-    
-    text = text.strip().lower()
-    
-    return any(keyword in text for keyword in BUDGET_KEYWORDS)
+    return _matches_budget_keywords(_normalize_text(text))
 
 
 def is_budget_related_content(text):
@@ -78,7 +90,8 @@ def is_budget_related_content(text):
     Returns:
         bool: True if content appears budget-related
     """
-    return contains_currency(text) or contains_budget_keywords(text)
+    text = _normalize_text(text)
+    return _matches_currency(text) or _matches_budget_keywords(text)
 
 
 def extract_currency_amounts(text):
@@ -95,9 +108,8 @@ def extract_currency_amounts(text):
         text = str(text)
     
     amounts = []
-    for pattern in CURRENCY_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        amounts.extend(matches)
+    for regex in CURRENCY_REGEXES:
+        amounts.extend(regex.findall(text))
     
     return amounts
 
@@ -119,9 +131,14 @@ def is_table_budget_related(dataframe):
     
     # Check cell contents (sample first few rows for performance)
     sample_size = min(10, len(dataframe))
-    for _, row in dataframe.head(sample_size).iterrows():
-        for cell in row:
-            if cell and is_budget_related_content(str(cell)):
-                return True
+    cells = pd.Series(dataframe.head(sample_size).to_numpy().ravel(), dtype=object)
+    cells = cells[cells.astype(bool)]
+    if cells.empty:
+        return False
+    
+    # Normalize once, then scan all sampled cells in vectorized passes
+    text = cells.astype(str).str.strip().str.lower()
+    if text.str.contains(BUDGET_KEYWORDS_REGEX).any():
+        return True
     
-    return False
+    return text.str.contains(CURRENCY_REGEX).any()
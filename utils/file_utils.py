@@ -2,23 +2,44 @@
 File Processing Utilities
 Handles reading and processing of different file formats
 """
+import hashlib
 import io
 import pandas as pd
 
 
+# Supported file extensions by processing path
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+CSV_OR_EXCEL_EXTENSIONS = ('.csv',) + EXCEL_EXTENSIONS
+DOCUMENT_OR_IMAGE_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif')
+SUPPORTED_EXTENSIONS = DOCUMENT_OR_IMAGE_EXTENSIONS + CSV_OR_EXCEL_EXTENSIONS
+
+
 def is_csv_or_excel_file(filename):
     """Check if file is CSV or Excel format."""
-    return filename.lower().endswith(('.csv', '.xlsx', '.xls'))
+    return filename.lower().endswith(CSV_OR_EXCEL_EXTENSIONS)
 
 
 def is_document_or_image_file(filename):
     """Check if file is a document or image format."""
-    return filename.lower().endswith(('.pdf', '.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif'))
+    return filename.lower().endswith(DOCUMENT_OR_IMAGE_EXTENSIONS)
 
 
 def is_excel_file(filename):
     """Check if file is Excel format."""
-    return filename.lower().endswith(('.xlsx', '.xls'))
+    return filename.lower().endswith(EXCEL_EXTENSIONS)
+
+
+def compute_file_hash(file_bytes):
+    """
+    Compute a content hash for file bytes.
+    
+    Args:
+        file_bytes (bytes): File content as bytes
+        
+    Returns:
+        str: SHA-256 hex digest of the content
+    """
+    return hashlib.sha256(file_bytes).hexdigest()
 
 
 def generate_excel_column_names(num_columns):
@@ -58,47 +79,20 @@ def read_csv_or_excel_file(file_bytes, file_name):
     """
     try:
         file_obj = io.BytesIO(file_bytes)
-        sheets = {}
         
         if is_excel_file(file_name):
-            # Handle Excel files with multiple sheets
-            excel_file = pd.ExcelFile(file_obj)
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None, dtype=str)
-                excel_columns = generate_excel_column_names(len(df.columns))
-                df.columns = excel_columns
-                df.index = range(1, len(df) + 1)
-                sheets[sheet_name] = df
+            # Handle Excel files with multiple sheets in a single parse (Rust-backed reader)
+            sheets = pd.read_excel(file_obj, sheet_name=None, header=None, dtype=str, engine='calamine')
         else:
-            # Handle CSV files
-            df = pd.read_csv(file_obj, header=None, dtype=str)
-            excel_columns = generate_excel_column_names(len(df.columns))
-            df.columns = excel_columns
+            # Handle CSV files (C parser: keeps cells verbatim and pads short rows)
+            sheets = {'Sheet1': pd.read_csv(file_obj, header=None, dtype=str)}
+        
+        # Label cells Excel-style: A, B, C columns; 1, 2, 3 rows
+        for df in sheets.values():
+            df.columns = generate_excel_column_names(len(df.columns))
             df.index = range(1, len(df) + 1)
-            sheets['Sheet1'] = df
         
         return None, None, None, sheets
     except Exception as e:
         raise RuntimeError(f"Error reading file '{file_name}': {e}")
 
-
-def clean_dataframe(df):
-    """
-    Clean a pandas DataFrame by removing empty rows and handling null values.
-    
-    Args:
-        df (pandas.DataFrame): DataFrame to clean
-        
-    Returns:
-        pandas.DataFrame: Cleaned DataFrame
-    """
-    # Remove completely empty rows
-    df = df.dropna(how='all')
-    
-    # Remove rows where all values are empty strings
-    df = df[~df.apply(lambda row: row.astype(str).str.strip().eq('').all(), axis=1)]
-    
-    # Reset index
-    df = df.reset_index(drop=True)
-    
-    return df